@@ -1,13 +1,17 @@
 import os
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence
 
 import streamlit as st
 
 from research_baby import (
     search_top_papers,
     get_top_citing_papers,
+    clear_cache,
+    doi_link,
     format_paper_line,
     Paper,
+    MAX_WORKERS,
 )
 
 st.set_page_config(
@@ -16,6 +20,65 @@ st.set_page_config(
     layout="wide",
 )
 
+
+class _EmptyResult(Exception):
+    """Raised instead of returning nothing, so st.cache_data (which skips exceptions) won't cache it."""
+
+
+# Shared across sessions: identical queries are answered without touching the API.
+# An empty result may just be a rate-limited or failed fetch, so it is never cached.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_search(q: str, y: int, n: int) -> List[Paper]:
+    papers = search_top_papers(q, y, n)
+    if not papers:
+        raise _EmptyResult(q)
+    return papers
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_cites(pid: str, k: int) -> Sequence[Paper]:
+    kids = get_top_citing_papers(pid, k)
+    if not kids:
+        raise _EmptyResult(pid)
+    return kids
+
+
+def _build_view(seeds_list: List[Paper]) -> List[Dict[str, Any]]:
+    """Pre-render seed headers and links once, so reruns only emit markdown."""
+    view = []
+    for idx, seed in enumerate(seeds_list, start=1):
+        # Build a nicer header line than the CLI
+        year = seed.year or "n/a"
+        cites = seed.citation_count or 0
+        link = doi_link((seed.external_ids or {}).get("DOI"), seed.url)
+
+        header = f"{idx}. {seed.title} ({year}) — {cites} cites"
+        if link:
+            header += " 🔗"
+
+        view.append({"paper_id": seed.paper_id, "header": header, "link": link})
+    return view
+
+
+def _child_lines(pending: "Future[Sequence[Paper]]") -> List[str]:
+    """Wait for one seed's prefetched citing papers and pre-render their lines."""
+    try:
+        kids = pending.result()
+    except Exception:
+        # Empty, failed or cancelled seeds show as empty instead of breaking the page
+        kids = []
+
+    lines = []
+    for j, child in enumerate(kids, start=1):
+        cyear = child.year or "n/a"
+        ccites = child.citation_count or 0
+        clink = doi_link((child.external_ids or {}).get("DOI"), child.url)
+
+        line = f"{j}. {child.title} ({cyear}) — {ccites} cites"
+        lines.append(f"{line}  🔗 [{clink}]({clink})" if clink else line)
+    return lines
+
+
 st.title("📚 Research, Baby!")
 st.caption("Topic → most-cited seeds → top citing papers (Semantic Scholar Graph API)")
 
@@ -60,9 +123,15 @@ with st.sidebar:
         help="If you have one, paste it here. Otherwise the app uses anonymous access.",
     )
     if api_key_input:
-        # Will be picked up by research_baby._make_session()
+        # Picked up by research_baby._get() on the next request
         os.environ["S2_API_KEY"] = api_key_input
 
+    if st.button("🧹 Clear cache", help="Forget cached Semantic Scholar responses and fetch fresh data."):
+        clear_cache()
+        _cached_search.clear()
+        _cached_cites.clear()
+        st.toast("Cache cleared.")
+
     st.markdown(
         """
         ℹ️ The app uses politeness & retry logic so it may take a minute for large searches. Grab some coffee!
@@ -82,30 +151,43 @@ if run_clicked:
         st.error("Please enter a topic query.")
     else:
         with st.spinner("Fetching papers from Semantic Scholar…"):
-            seeds_list: List[Paper] = search_top_papers(query, int(min_year), int(seeds))
-
-            if not seeds_list:
-                st.warning(
-                    f"No papers found for '{query}' with year ≥ {min_year}. "
-                    "Try lowering the year or broadening the query."
-                )
-                st.session_state.results = None
-            else:
-                children_map: Dict[str, List[Paper]] = {}
-                for seed in seeds_list:
-                    try:
-                        kids = get_top_citing_papers(seed.paper_id, int(children_count))
-                    except Exception:
-                        kids = []
-                    children_map[seed.paper_id] = kids
-
-                st.session_state.results = {
-                    "query": query,
-                    "min_year": int(min_year),
-                    "seeds": seeds_list,
-                    "children_map": children_map,
-                    "children_count": int(children_count),
-                }
+            try:
+                seeds_list: List[Paper] = _cached_search(query, int(min_year), int(seeds))
+            except _EmptyResult:
+                seeds_list = []
+
+        # The previous results are being replaced: drop citations still queued for them
+        previous = st.session_state.get("prefetch")
+        if previous is not None:
+            previous.shutdown(wait=False, cancel_futures=True)
+            st.session_state.prefetch = None
+
+        if not seeds_list:
+            st.warning(
+                f"No papers found for '{query}' with year ≥ {min_year}. "
+                "Try lowering the year or broadening the query."
+            )
+            st.session_state.results = None
+        else:
+            # Warm every seed's citations in the background; rendering below only
+            # blocks on the expander it is drawing, while later ones keep loading.
+            executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+            pending: Dict[str, "Future[Sequence[Paper]]"] = {
+                seed.paper_id: executor.submit(_cached_cites, seed.paper_id, int(children_count))
+                for seed in seeds_list
+            }
+            # Let the worker threads exit once the queue drains
+            executor.shutdown(wait=False)
+            st.session_state.prefetch = executor
+
+            st.session_state.results = {
+                "query": query,
+                "min_year": int(min_year),
+                "seeds": seeds_list,
+                "pending": pending,
+                "children_count": int(children_count),
+                "view": _build_view(seeds_list),
+            }
 
 results = st.session_state.results
 
@@ -120,39 +202,22 @@ if results:
         f"• **Children per seed:** {results['children_count']}"
     )
 
-    for idx, seed in enumerate(results["seeds"], start=1):
-        # Build a nicer header line than the CLI
-        year = seed.year or "n/a"
-        cites = seed.citation_count or 0
-        doi = (seed.external_ids or {}).get("DOI")
-        link = f"https://doi.org/{doi}" if doi else (seed.url or "")
-
-        header = f"{idx}. {seed.title} ({year}) — {cites} cites"
-        if link:
-            header += " 🔗"
-
-        with st.expander(header, expanded=(idx == 1)):
-            if link:
-                st.markdown(f"[Open paper]({link})")
+    for idx, seed_view in enumerate(results["view"], start=1):
+        with st.expander(seed_view["header"], expanded=(idx == 1)):
+            if seed_view["link"]:
+                st.markdown(f"[Open paper]({seed_view['link']})")
 
             st.markdown("**Top citing papers:**")
 
-            kids: List[Paper] = results["children_map"].get(seed.paper_id, [])
+            if "children" not in seed_view:
+                with st.spinner("Fetching citing papers…"):
+                    seed_view["children"] = _child_lines(results["pending"][seed_view["paper_id"]])
 
-            if not kids:
+            if not seed_view["children"]:
                 st.write("_No citing papers found (or fetch failed for this seed)._")
             else:
-                for j, child in enumerate(kids, start=1):
-                    cyear = child.year or "n/a"
-                    ccites = child.citation_count or 0
-                    cdoi = (child.external_ids or {}).get("DOI")
-                    clink = f"https://doi.org/{cdoi}" if cdoi else (child.url or "")
-
-                    line = f"{j}. {child.title} ({cyear}) — {ccites} cites"
-                    if clink:
-                        st.markdown(f"{line}  🔗 [{clink}]({clink})")
-                    else:
-                        st.markdown(line)
+                for line in seed_view["children"]:
+                    st.markdown(line)
 
     st.markdown("---")
     st.caption("Built on Semantic Scholar Graph API · backed by your original research_baby.py")
@@ -13,35 +13,64 @@ Notes:
   - No CLI flags were added compared with your version.
   - The script is now much more resilient to rate limits:
       * honors Retry-After
-      * exponential backoff + jitter
+      * exponential backoff + decorrelated jitter (urllib3 Retry on the session)
+      * adaptive request pacing (token bucket, faster with an API key)
       * smaller page sizes
       * graceful fallbacks (continues instead of crashing)
+  - Successful responses are cached on disk for 24h, so repeated runs of the same
+    query don't hit the API again. The cache lives in s2_cache.sqlite next to this
+    script; set S2_CACHE_PATH to put it elsewhere.
   - If you have an API key, set it via env var:
       * S2_API_KEY or SEMANTIC_SCHOLAR_API_KEY
 """
 
 import argparse
+import heapq
 import os
 import sys
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, Iterator, List, Dict, Any, Optional, Sequence, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 API_BASE = "https://api.semanticscholar.org/graph/v1"
+PAPER_FIELDS = "title,year,citationCount,externalIds,url"
 
 # --- Politeness & paging defaults (tuned to avoid 429s without CLI args) ---
-BASE_SLEEP = 1.5          # base delay between requests (seconds)
+BASE_SLEEP = 1.5          # retry backoff unit (seconds)
+MAX_BACKOFF = 15.0        # cap on a single retry wait (seconds)
+RATE_ANON = 1.0           # requests/second without an API key
+RATE_WITH_KEY = 10.0      # requests/second with an API key
+MIN_RATE = 0.25           # floor when backing off after 429s
+RATE_RECOVERY = 10        # consecutive successes before the rate doubles back up
+SEARCH_RETRIES = 10       # a failed search empties the whole run, so it waits longer
+MAX_RETRIES = 6           # other endpoints: a failure only costs one seed's children
+_RETRY_RATE = frozenset({429, 503})           # overload signals: retry after Retry-After, slow down
+_RETRY_TRANSIENT = frozenset({500, 502, 504})  # transient server errors: retry with backoff
 SEARCH_PAGE_SIZE = 25     # smaller pages reduce rate-limit hits
 CITES_PAGE_SIZE = 25
 SEARCH_MAX_PAGES = 12     # up to ~300 search results scanned
 CITES_MAX_PAGES = 12      # up to ~300 citing items scanned
 CITES_OVERSAMPLE = 4      # fetch ~top_k * this many before sorting
+BATCH_MAX_IDS = 500       # /paper/batch accepts at most this many IDs per call
+# On-disk response cache, keyed by URL + params; next to this module unless S2_CACHE_PATH is set
+CACHE_PATH = os.getenv("S2_CACHE_PATH") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "s2_cache.sqlite")
+CACHE_TTL = 24 * 3600     # seconds before a cached response is refetched
+CITES_MEMO_TTL = 3600     # seconds an in-process citation lookup is reused
+CITES_MEMO_SIZE = 512     # max memoized (paper_id, top_k) lookups
+MAX_WORKERS = 8           # parallel per-seed fetches; stays under the per-key rate limit
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Paper:
     paper_id: str
     title: str
@@ -51,200 +80,383 @@ class Paper:
     external_ids: Dict[str, Any]
 
 
-def _make_session() -> requests.Session:
-    """Build a session with UA and optional API key from env."""
-    s = requests.Session()
-    s.headers.update({"User-Agent": "topic-tree/1.2 (+https://semanticscholar.org)"})
+class _TokenBucket:
+    """
+    Thread-safe token bucket pacing requests to the API. The rate halves on every 429/503 and doubles
+    back after a run of successes (AIMD), never exceeding the ceiling for the current access level.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._lock = threading.Lock()
+        self.ceiling = self.rate = rate
+        self._tokens = rate
+        self._stamp = time.monotonic()
+        self._streak = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.ceiling, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until it is due."""
+        with self._lock:
+            self._refill()
+            # Tokens may go negative: later callers queue up behind this reservation
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttle(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = max(self.rate / 2, MIN_RATE)
+            self._streak = 0
+
+    def reward(self) -> None:
+        with self._lock:
+            self._streak += 1
+            if self._streak >= RATE_RECOVERY and self.rate < self.ceiling:
+                self._refill()
+                self.rate = min(self.rate * 2, self.ceiling)
+                self._streak = 0
+
+    def set_ceiling(self, rate: float) -> None:
+        with self._lock:
+            if rate != self.ceiling:
+                self._refill()
+                self.ceiling = self.rate = rate
+
+
+_RATE = _TokenBucket(RATE_ANON)
+
+
+def _sync_api_key(sess: requests.Session) -> None:
+    """Apply the API key from env to the session; it may be set after import (Streamlit sidebar)."""
     api_key = os.getenv("S2_API_KEY") or os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    _RATE.set_ceiling(RATE_WITH_KEY if api_key else RATE_ANON)
     if api_key:
         # S2 accepts x-api-key; Authorization: Bearer also works, but this is simpler
-        s.headers.update({"x-api-key": api_key})
+        if sess.headers.get("x-api-key") != api_key:
+            sess.headers["x-api-key"] = api_key
+    else:
+        sess.headers.pop("x-api-key", None)
+
+
+class _JitterRetry(Retry):
+    """Retry with decorrelated jitter, so parallel workers hitting a 429 don't retry in lockstep."""
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if response is not None and response.status in _RETRY_RATE:
+            _RATE.throttle()
+        return super().increment(method, url, response, *args, **kwargs)
+
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0.0
+        ceiling = max(super().get_backoff_time(), self.backoff_factor) * 3
+        return min(self.backoff_max, random.uniform(self.backoff_factor, ceiling))
+
+
+def _make_retry(total: int) -> Retry:
+    """Retry policy for the transport: honors Retry-After, backs off on 429/5xx."""
+    return _JitterRetry(
+        total=total,
+        backoff_factor=BASE_SLEEP,
+        backoff_max=MAX_BACKOFF,
+        status_forcelist=_RETRY_RATE | _RETRY_TRANSIENT,
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+        # Hand the last response back instead of raising, so callers can fall back gracefully
+        raise_on_status=False,
+    )
+
+
+class _PacedAdapter(HTTPAdapter):
+    """Adapter that takes a rate token per request; cache hits never reach it, so they are not paced."""
+
+    def send(self, request, *args, **kwargs):
+        _RATE.acquire()
+        resp = super().send(request, *args, **kwargs)
+        if resp.ok:
+            _RATE.reward()
+        return resp
+
+
+def _make_session() -> requests.Session:
+    """Build a cached, pooled session with UA, retry policy and optional API key from env."""
+    # Only 200s are cached so 429/5xx responses are still retried on the next attempt;
+    # the SQLite backend handles locking between threads sharing the file.
+    # Expired entries with an ETag/Last-Modified are revalidated by requests-cache out of the box
+    # (If-None-Match / If-Modified-Since; a 304 renews them without a body). Server Cache-Control
+    # headers are deliberately not honored, so they can't shorten CACHE_TTL.
+    s = CachedSession(CACHE_PATH, backend="sqlite", expire_after=CACHE_TTL, allowable_codes=(200,))
+    s.headers.update({"User-Agent": "topic-tree/1.2 (+https://semanticscholar.org)"})
+    # Resolve proxy/CA settings from env once here; with trust_env on, requests re-reads
+    # env proxies and ~/.netrc on every single request.
+    s.trust_env = False
+    s.proxies.update(requests.utils.get_environ_proxies(API_BASE))
+    s.verify = os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE") or True
+    # Sized for MAX_WORKERS seeds, each with a page in flight plus one being prefetched
+    s.mount("https://", _PacedAdapter(pool_connections=16, pool_maxsize=32, max_retries=_make_retry(MAX_RETRIES)))
+    # requests picks the longest matching prefix, so search gets its own, more patient policy
+    s.mount(f"{API_BASE}/paper/search", _PacedAdapter(pool_maxsize=4, max_retries=_make_retry(SEARCH_RETRIES)))
+    _sync_api_key(s)
     return s
 
 
-def _get(
+# Shared by every call (and thread) so TLS handshakes are amortized over the whole run
+_SESSION = _make_session()
+
+
+def clear_cache() -> None:
+    """Drop every cached API response and memoized citation lookup."""
+    _SESSION.cache.clear()
+    with _cites_memo_lock:
+        _cites_memo.clear()
+
+
+def _request(
+    method: str,
     url: str,
     params: Dict[str, Any],
-    max_retries: int = 10,
+    json: Optional[Any] = None,
     timeout: int = 60,
-    session: Optional[requests.Session] = None,
-    base_sleep: float = BASE_SLEEP,
-) -> Dict[str, Any]:
+    session: requests.Session = _SESSION,
+) -> Any:
     """
-    GET with Retry-After handling, exponential backoff, and jitter.
+    HTTP request through the session's retry policy (Retry-After, backoff, jitter).
     Returns {"data": []} on hard/irrecoverable errors to keep pipeline going.
     """
-    sess = session or _make_session()
-    backoff = base_sleep
+    _sync_api_key(session)
+    try:
+        resp = session.request(method, url, params=params, json=json, timeout=timeout)
+    except requests.RequestException:
+        # Connection errors that outlived every retry
+        return {"data": []}
+
+    # Non-retryable, or still failing after the last retry: not worth blocking the whole run
+    if not resp.ok:
+        return {"data": []}
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        return {"data": []}
 
-    for attempt in range(max_retries):
-        try:
-            resp = sess.get(url, params=params, timeout=timeout)
-        except requests.RequestException:
-            time.sleep(backoff + random.uniform(0, 0.5))
-            backoff = min(backoff * 1.8, 12.0)
-            continue
 
-        if resp.status_code == 200:
-            # Small jitter even on success to avoid burstiness
-            time.sleep(base_sleep * 0.4 + random.uniform(0, 0.4))
-            try:
-                return resp.json()
-            except Exception:
-                return {"data": []}
-
-        # Honor Retry-After on 429/503
-        if resp.status_code in (429, 503):
-            ra = resp.headers.get("Retry-After")
-            if ra:
-                try:
-                    sleep_for = float(ra)
-                except ValueError:
-                    sleep_for = backoff
-            else:
-                sleep_for = backoff
-            time.sleep(sleep_for + random.uniform(0, 0.6))
-            backoff = min(backoff * 2.0, 15.0)
-            continue
+def _get(url: str, params: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    return _request("GET", url, params, **kwargs)
 
-        # Transient server errors → exponential backoff
-        if resp.status_code in (500, 502, 504):
-            time.sleep(backoff + random.uniform(0, 0.6))
-            backoff = min(backoff * 2.0, 15.0)
-            continue
 
-        # Non-retryable / not worth blocking the whole run
-        if resp.status_code in (400, 401, 403, 404):
-            return {"data": []}
+def _paper_from_json(r: Dict[str, Any]) -> Paper:
+    return Paper(
+        paper_id=r.get("paperId") or "",
+        title=(r.get("title") or "").strip() or "(untitled)",
+        year=r.get("year"),
+        citation_count=int(r.get("citationCount") or 0),
+        url=r.get("url") or "",
+        external_ids=r.get("externalIds") or {},
+    )
 
-        # Unknown status: brief wait then try again
-        time.sleep(backoff + random.uniform(0, 0.5))
-        backoff = min(backoff * 1.8, 12.0)
 
-    # Final fallback: do not crash caller
-    return {"data": []}
+def _iter_pages(
+    url: str,
+    params: Dict[str, Any],
+    page_size: int,
+    max_pages: int,
+    want_more: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the "data" list of each page of an offset-paginated endpoint, stopping after the first
+    empty or short page (a short page is the last one, so no request is spent confirming the end).
+    The next page is requested in a background thread while the caller parses the current one;
+    pacing is left to the session's rate limiter. `want_more(items)` is asked before each prefetch,
+    so no page is requested once the caller has what it needs.
+    """
 
+    def fetch(offset: int) -> Dict[str, Any]:
+        return _get(url, {**params, "limit": page_size, "offset": offset})
 
+    # A single worker keeps at most one request in flight besides the page being parsed
+    ex = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = ex.submit(fetch, 0)
+        for page in range(max_pages):
+            items = pending.result().get("data", []) or []
+            if not items:
+                return
+            more = (
+                page + 1 < max_pages
+                and len(items) >= page_size
+                and (want_more is None or want_more(items))
+            )
+            if more:
+                pending = ex.submit(fetch, (page + 1) * page_size)
+            yield items
+            if not more:
+                return
+    finally:
+        # Never block a caller that stops early on a prefetch it won't read
+        ex.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1024)
 def _sanitize_query(q: str) -> str:
     """Fallback query: remove quotes and collapse whitespace."""
     return " ".join(q.replace('"', " ").split())
 
 
+def _by_cites(p: Paper) -> int:
+    return p.citation_count or 0
+
+
+def _iter_search_papers(query: str, min_year: int, stop_after: int) -> Iterator[Paper]:
+    """
+    Stream search hits with year >= min_year as each page parses, ending with the page on which
+    `stop_after` hits have been seen. Falls back to a sanitized query if the raw one finds nothing.
+    """
+    params = {"fields": PAPER_FIELDS}
+    seen = 0
+
+    def in_range(r: Dict[str, Any]) -> bool:
+        year = r.get("year")
+        return year is not None and year >= min_year
+
+    def want_more(results: List[Dict[str, Any]]) -> bool:
+        nonlocal seen
+        seen += sum(1 for r in results if in_range(r))
+        return seen < stop_after
+
+    for q in dict.fromkeys((query, _sanitize_query(query))):
+        got_page = False
+        url = f"{API_BASE}/paper/search"
+        for results in _iter_pages(url, {**params, "query": q}, SEARCH_PAGE_SIZE, SEARCH_MAX_PAGES, want_more):
+            got_page = True
+            for r in results:
+                if in_range(r):
+                    yield _paper_from_json(r)
+        if got_page:
+            return
+
+
+def _iter_citing_papers(paper_id: str, stop_after: int) -> Iterator[Paper]:
+    """Stream the papers citing `paper_id` as each page parses, ending once `stop_after` have been seen."""
+    base_fields = PAPER_FIELDS + ",paperId"
+    params = {"fields": ",".join([f"citingPaper.{f}" for f in base_fields.split(",")])}
+    # Full pages until the target is met, so the page count is known up front
+    max_pages = min(CITES_MAX_PAGES, -(-stop_after // CITES_PAGE_SIZE))
+
+    for items in _iter_pages(f"{API_BASE}/paper/{paper_id}/citations", params, CITES_PAGE_SIZE, max_pages):
+        for item in items:
+            yield _paper_from_json((item or {}).get("citingPaper") or {})
+
+
 def search_top_papers(query: str, min_year: int, limit: int) -> List[Paper]:
     """
     Search papers for a topic, filter by min_year, sort by citationCount desc, and return top-N.
-    Uses small pages, polite delays, and a sanitized-query fallback for page 0.
+    Uses small pages, rate-limited prefetching, and a sanitized-query fallback for page 0.
+    Hits are streamed into a size-`limit` heap, so discarded candidates are never held together.
     """
-    fields = "title,year,citationCount,externalIds,url"
-    sess = _make_session()
-    fetched: List[Paper] = []
-    offset = 0
-
-    for page in range(SEARCH_MAX_PAGES):
-        if len(fetched) >= limit:
-            break
-        payload = {"query": query, "limit": SEARCH_PAGE_SIZE, "offset": offset, "fields": fields}
-        data = _get(f"{API_BASE}/paper/search", payload, session=sess)
-        results = data.get("data", []) or []
-
-        # If page 0 was empty, try a sanitized version of the query once
-        if not results and page == 0:
-            q2 = _sanitize_query(query)
-            if q2 != query:
-                payload["query"] = q2
-                data = _get(f"{API_BASE}/paper/search", payload, session=sess)
-                results = data.get("data", []) or []
-
-        if not results:
-            break
-
-        for r in results:
-            year = r.get("year")
-            if year is None or year < min_year:
-                continue
-            fetched.append(
-                Paper(
-                    paper_id=r.get("paperId") or "",
-                    title=(r.get("title") or "").strip() or "(untitled)",
-                    year=year,
-                    citation_count=int(r.get("citationCount") or 0),
-                    url=r.get("url") or "",
-                    external_ids=r.get("externalIds") or {},
-                )
-            )
+    return heapq.nlargest(limit, _iter_search_papers(query, min_year, limit), key=_by_cites)
 
-        offset += SEARCH_PAGE_SIZE
-        time.sleep(BASE_SLEEP + random.uniform(0, 0.3))
 
-    fetched.sort(key=lambda p: (p.citation_count or 0), reverse=True)
-    return fetched[:limit]
+# (paper_id, top_k) -> (stored at, result); insertion-ordered, so the first key is the oldest
+_cites_memo: Dict[Tuple[str, int], Tuple[float, Tuple[Paper, ...]]] = {}
+_cites_memo_lock = threading.Lock()
 
 
-def get_top_citing_papers(paper_id: str, top_k: int) -> List[Paper]:
+def get_top_citing_papers(paper_id: str, top_k: int) -> Tuple[Paper, ...]:
     """
-    For a given paper, fetch papers that cite it, sort by citationCount desc, return top_k.
-    Uses small pages and oversampling to avoid needing all pages.
+    For a given paper, fetch papers that cite it and return the top_k by citationCount desc.
+    Uses small pages and oversampling to avoid needing all pages; the citations endpoint
+    has no server-side sort, so selection happens locally over the streamed pages.
+    Non-empty results are memoized per process for CITES_MEMO_TTL (seeds shared across runs
+    are fetched once), hence the tuple; empty ones may be a failed fetch and are not kept.
     """
     if not paper_id:
-        return []
+        return ()
 
-    sess = _make_session()
-    base_fields = "title,year,citationCount,url,externalIds,paperId"
-    fields = ",".join([f"citingPaper.{f}" for f in base_fields.split(",")])
+    key = (paper_id, top_k)
+    with _cites_memo_lock:
+        hit = _cites_memo.get(key)
+    if hit is not None and time.monotonic() - hit[0] < CITES_MEMO_TTL:
+        return hit[1]
 
-    offset = 0
-    citing: List[Paper] = []
     target_count = max(top_k * CITES_OVERSAMPLE, 80)
+    kids = tuple(heapq.nlargest(top_k, _iter_citing_papers(paper_id, target_count), key=_by_cites))
+    if kids:
+        with _cites_memo_lock:
+            _cites_memo.pop(key, None)
+            _cites_memo[key] = (time.monotonic(), kids)
+            while len(_cites_memo) > CITES_MEMO_SIZE:
+                del _cites_memo[next(iter(_cites_memo))]
+    return kids
 
-    for _ in range(CITES_MAX_PAGES):
-        if len(citing) >= target_count:
-            break
 
-        payload = {"fields": fields, "limit": CITES_PAGE_SIZE, "offset": offset}
-        data = _get(f"{API_BASE}/paper/{paper_id}/citations", payload, session=sess)
-        items = data.get("data", []) or []
-        if not items:
-            break
+def get_papers_batch(ids: List[str], fields: str = PAPER_FIELDS) -> List[Paper]:
+    """
+    Fetch metadata for many papers with POST /paper/batch: one round trip per 500 IDs instead of one per paper.
+    Unknown IDs are dropped; the remaining papers keep the order of `ids`.
+    """
+    papers: List[Paper] = []
+    for start in range(0, len(ids), BATCH_MAX_IDS):
+        chunk = ids[start:start + BATCH_MAX_IDS]
+        data = _request("POST", f"{API_BASE}/paper/batch", {"fields": fields}, json={"ids": chunk})
+        # The batch endpoint answers with a bare list (null for unknown IDs), not {"data": [...]}
+        if isinstance(data, list):
+            papers.extend(_paper_from_json(r) for r in data if r)
+    return papers
+
+
+def fetch_children(
+    seeds: List[Paper],
+    top_k: int,
+    fetch: Callable[[str, int], Sequence[Paper]] = get_top_citing_papers,
+) -> Dict[str, Sequence[Paper]]:
+    """
+    Fetch the top citing papers of every seed concurrently (I/O bound, so threads suffice).
+    A seed whose fetch raises maps to an empty list instead of aborting the run.
+    """
 
-        for item in items:
-            cp = (item or {}).get("citingPaper") or {}
-            citing.append(
-                Paper(
-                    paper_id=cp.get("paperId") or "",
-                    title=(cp.get("title") or "").strip() or "(untitled)",
-                    year=cp.get("year"),
-                    citation_count=int(cp.get("citationCount") or 0),
-                    url=cp.get("url") or "",
-                    external_ids=cp.get("externalIds") or {},
-                )
-            )
+    def _safe_fetch(seed: Paper) -> Sequence[Paper]:
+        try:
+            return fetch(seed.paper_id, top_k)
+        except Exception:
+            return ()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        kids = list(ex.map(_safe_fetch, seeds))
+    return {seed.paper_id: k for seed, k in zip(seeds, kids)}
 
-        offset += CITES_PAGE_SIZE
-        time.sleep(BASE_SLEEP * 0.8 + random.uniform(0, 0.4))
 
-    citing.sort(key=lambda p: (p.citation_count or 0), reverse=True)
-    return citing[:top_k]
+@lru_cache(maxsize=4096)
+def doi_link(doi: Optional[str], url: Optional[str]) -> str:
+    """Preferred link for a paper: its DOI resolver URL, else the Semantic Scholar URL, else ''."""
+    return f"https://doi.org/{doi}" if doi else (url or "")
 
 
 def format_paper_line(p: Paper, prefix: str = "") -> str:
     year = p.year if p.year is not None else "n/a"
     cites = p.citation_count if p.citation_count is not None else 0
-    doi = (p.external_ids or {}).get("DOI")
-    link = f"https://doi.org/{doi}" if doi else (p.url or "")
+    link = doi_link((p.external_ids or {}).get("DOI"), p.url)
     link_suffix = f"  <{link}>" if link else ""
     return f"{prefix}{p.title} — {year} — {cites} cites{link_suffix}"
 
 
-def print_tree(seeds: List[Paper], children_map: Dict[str, List[Paper]], children_count: int):
+def print_tree(seeds: List[Paper], children_map: Dict[str, Sequence[Paper]], children_count: int):
+    # Collect every line and emit them in one write instead of one print (and syscall) per line
+    out: List[str] = []
     for i, seed in enumerate(seeds, 1):
-        print(f"{i}. {format_paper_line(seed)}")
+        out.append(format_paper_line(seed, prefix=f"{i}. "))
         kids = children_map.get(seed.paper_id, [])
         if not kids:
-            print("   └─ (no citing papers found)")
+            out.append("   └─ (no citing papers found)")
             continue
         for j, child in enumerate(kids, 1):
             branch = "   ├─" if j < children_count else "   └─"
-            print(f"{branch} {format_paper_line(child)}")
+            out.append(format_paper_line(child, prefix=f"{branch} "))
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -261,14 +473,8 @@ def main():
             print(f"No papers found for '{args.query}' with year ≥ {args.min_year}.")
             sys.exit(0)
 
-        children_map: Dict[str, List[Paper]] = {}
-        for seed in seeds:
-            # If a seed causes trouble, we skip it gracefully
-            try:
-                kids = get_top_citing_papers(seed.paper_id, args.children)
-            except Exception:
-                kids = []
-            children_map[seed.paper_id] = kids
+        # If a seed causes trouble, it is skipped gracefully
+        children_map = fetch_children(seeds, args.children)
 
         print(f"\nTOPIC: {args.query}")
         print(f"Year cutoff: ≥ {args.min_year}")